@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dbmail', '0010_textofemail_messagerequest'),
+    ]
+
+    # The mailgate looks up redirects with original__iexact, which Postgres
+    # compiles to UPPER("original") = UPPER(%s). A functional index on
+    # UPPER(original) lets that lookup use an index scan instead of scanning
+    # the whole table on every incoming message.
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX dbmail_plainredirect_original_upper ON dbmail_plainredirect (UPPER(original));',
+            reverse_sql='DROP INDEX dbmail_plainredirect_original_upper;',
+        ),
+    ]
@@ -41,6 +41,9 @@ import pickle
 import re
 import sys
 
+from email.utils import parseaddr
+from functools import lru_cache
+
 from django.db import models, transaction
 from django.db.models import Q
 from argcache import cache_function
@@ -62,6 +65,19 @@ from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
 from django.core.mail.message import sanitize_address
 from django.core.exceptions import ImproperlyConfigured
 
+# The 'From' address must match one of our DMARC domains/subdomains, or the
+# email may be rejected by email clients. The pattern only depends on settings,
+# so compile it once at import time.
+DMARC_SENDER_RE = re.compile(r'(^.+@{0}$)|(^.+<.+@{0}>$)|(^.+@(\w+\.)?learningu\.org$)|(^.+<.+@(\w+\.)?learningu\.org>$)'.format(settings.SITE_INFO[1].replace('.', '\.')))
+
+# Runs of spaces/tabs collapse to a single space, or vanish entirely right
+# after a newline; used to derive a plaintext body from an HTML message in a
+# single pass instead of one substitution pass per transformation.
+_PLAINTEXT_WS_RE = re.compile(r'(\n)?[ \t]+')
+
+def _plaintext_ws_repl(match):
+    return '\n' if match.group(1) else ' '
+
 # `user` is required for marketing and subscribed messages to add unsubscribe headers
 # this includes all comm panel emails
 # https://support.google.com/a/answer/81126?visit_id=638428689824104778-3542874255&rd=1#subscriptions
@@ -69,9 +85,7 @@ def send_mail(subject, message, from_email, recipient_list, fail_silently=False,
               return_path=settings.DEFAULT_EMAIL_ADDRESSES['bounces'], extra_headers={}, user=None,
               *args, **kwargs):
     from_email = from_email.strip()
-    # the from_email must match one of our DMARC domains/subdomains
-    # or the email may be rejected by email clients
-    if not re.match(r'(^.+@{0}$)|(^.+<.+@{0}>$)|(^.+@(\w+\.)?learningu\.org$)|(^.+<.+@(\w+\.)?learningu\.org>$)'.format(settings.SITE_INFO[1].replace('.', '\.')), from_email):
+    if not DMARC_SENDER_RE.match(from_email):
         raise ESPError("Invalid 'From' email address (" + from_email + "). The 'From' email address must " +
                        "end in @" + settings.SITE_INFO[1] + " (your website), " +
                        "@learningu.org, or a valid subdomain of learningu.org " +
@@ -82,24 +96,26 @@ def send_mail(subject, message, from_email, recipient_list, fail_silently=False,
     if isinstance(recipient_list, str):
         new_list = [ recipient_list ]
     else:
-        new_list = [ x for x in recipient_list ]
+        new_list = list(recipient_list)
+    # nothing to do with no recipients; skip the dedup and connection setup
+    if not new_list and not bcc:
+        logger.info("Skipping send_mail with no recipients")
+        return
     if user is not None:
         extra_headers['List-Unsubscribe-Post'] = "List-Unsubscribe=One-Click"
         extra_headers['List-Unsubscribe'] = '<%s>' % (user.unsubscribe_oneclick())
 
     # remove duplicate email addresses (sendgrid doesn't like them)
+    # the first occurrence of each bare address wins
     recipients = []
-    pat = '<(.+)>'
-    emails = {re.search(pat, x).group(1) if re.search(pat, x) else x for x in new_list}
+    seen = set()
     for x in new_list:
-        if x in emails and not re.search(pat, x):
+        # parseaddr handles quoted display names and RFC 5322 corner cases
+        # that a naive angle-bracket scan would mishandle
+        addr = parseaddr(x)[1] or x
+        if addr not in seen:
             recipients.append(x)
-            emails.remove(x)
-        elif re.search(pat, x):
-            tmp = re.search(pat, x).group(1)
-            if tmp in emails:
-                recipients.append(x)
-                emails.remove(tmp)
+            seen.add(addr)
 
     from django.core.mail import EmailMessage, EmailMultiAlternatives #send_mail as django_send_mail
     logger.info("Sent mail to %s", recipients)
@@ -110,11 +126,10 @@ def send_mail(subject, message, from_email, recipient_list, fail_silently=False,
 
     #   Detect HTML tags in message and change content-type if they are found
     if '<html>' in message:
-        # Generate a plaintext version of the email
-        # Remove html tags and continuous whitespaces
-        text_only = re.sub('[ \t]+', ' ', strip_tags(message))
-        # Strip single spaces in the beginning of each line
-        message_text = text_only.replace('\n ', '\n').strip()
+        # Generate a plaintext version of the email:
+        # remove html tags, collapse runs of spaces/tabs, and strip them from
+        # the beginning of each line, all in a single pass over the text
+        message_text = _PLAINTEXT_WS_RE.sub(_plaintext_ws_repl, strip_tags(message)).strip()
         msg = EmailMultiAlternatives(subject, message_text, from_email, recipients, bcc=bcc, connection=connection, headers=extra_headers)
         msg.attach_alternative(message, "text/html")
     else:
@@ -164,6 +179,17 @@ _MESSAGE_CREATED_AT_HELP_TEXT = """
 """
 _MESSAGE_CREATED_AT_HELP_TEXT = re.sub(r'\s+', ' ', _MESSAGE_CREATED_AT_HELP_TEXT.strip())
 
+@lru_cache(maxsize=128)
+def _compile_template(text):
+    """Compile a template for parseSmartText, caching the result.
+
+    Processing a MessageRequest renders the same subject and message text
+    once per recipient; caching the compiled Template means each distinct
+    text is parsed only once per batch. Compiled Templates are safe to
+    render concurrently.
+    """
+    return Template(text)
+
 @python_2_unicode_compatible
 class MessageRequest(models.Model):
     """ An initial request to broadcast an email message """
@@ -275,8 +301,7 @@ class MessageRequest(models.Model):
 
         context = MessageVars.getContext(self, user)
 
-        newtext = ''
-        template = Template(text)
+        template = _compile_template(text)
 
         return template.render(context)
 
@@ -442,14 +467,10 @@ class TextOfEmail(models.Model):
         have not already been sent, and which do not have too many retries.
         """
 
-        parent_request = None
-        if self.emailrequest_set.count() > 0:
-            parent_request = self.emailrequest_set.all()[0].msgreq
-
-        if parent_request is not None:
-            extra_headers = parent_request.special_headers_dict
-        else:
-            extra_headers = {}
+        # self.messagerequest is a required FK (0010_textofemail_messagerequest),
+        # so use it directly instead of counting and re-fetching the related
+        # EmailRequest just to reach the same MessageRequest.
+        extra_headers = self.messagerequest.special_headers_dict
 
         now = datetime.now()
 
@@ -539,10 +560,17 @@ class MessageVars(models.Model):
     def getContext(msgrequest, user):
         """ Get a context-like dictionary for template rendering. """
         from django.template import Context  ## aseering 8-13-2010 -- Yes, this is supposed to be 'Context', not 'RequestContext'.
+        # Processing a MessageRequest builds a context once per recipient, and
+        # the providers are identical each time; fetch and unpickle them only
+        # once per request, then just rebind the per-user ActionHandlers.
+        providers = getattr(msgrequest, '_cached_providers', None)
+        if providers is None:
+            providers = [(msgvar.provider_name, pickle.loads(msgvar.pickled_provider))
+                         for msgvar in msgrequest.messagevars_set.all()]
+            msgrequest._cached_providers = providers
         context = {}
-        msgvars = msgrequest.messagevars_set.all()
-        for msgvar in msgvars:
-            context.update(msgvar.getDict(user))
+        for provider_name, provider in providers:
+            context[provider_name] = ActionHandler(provider, user)
         context['request'] = ActionHandler(msgrequest, user) # add the request so the public url is accessible
         context['EMAIL_HOST_SENDER'] = settings.EMAIL_HOST_SENDER # add the host address
         return Context(context)
@@ -608,12 +636,12 @@ class EmailList(models.Model):
 
     def save(self, *args, **kwargs):
         if self.seq is None:
-            try:
-                self.seq = EmailList.objects.order_by('-seq')[0].seq + 5
-            except EmailList.DoesNotExist:
-                self.seq = 0
-            except IndexError:
+            # only the largest seq is needed; don't hydrate a full EmailList row
+            max_seq = EmailList.objects.order_by('-seq').values_list('seq', flat=True).first()
+            if max_seq is None:
                 self.seq = 0
+            else:
+                self.seq = max_seq + 5
 
         super().save(*args, **kwargs)
 
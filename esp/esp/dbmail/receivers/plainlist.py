@@ -7,13 +7,21 @@ class PlainList(BaseHandler):
 
     def process(self, user, user_match):
 
-        redirects = PlainRedirect.objects.filter(original__iexact = user)
-
-        if len(redirects.values('id')[:1]) == 0:
+        # Fetch the destinations directly, so the existence check and the
+        # recipient list share a single query.
+        destinations = PlainRedirect.objects.filter(original__iexact = user) \
+                                            .exclude(destination = '') \
+                                            .values_list('destination', flat=True)
+
+        # A destination may hold a comma-separated list of addresses; split,
+        # strip, and drop empty entries in a single pass.
+        self.recipients = [addr for dest in destinations
+                           for addr in (a.strip() for a in dest.split(','))
+                           if addr]
+
+        if not self.recipients:
             return
 
-        self.recipients = [redirect.destination for redirect in redirects]
-
         self.send = True
 
         return
@@ -20,8 +20,9 @@ from esp.users.models import ESPUser
 
 
 def _setup_roles():
-    for name in ['Student', 'Teacher', 'Educator', 'Guardian', 'Volunteer', 'Administrator']:
-        Group.objects.get_or_create(name=name)
+    names = ['Student', 'Teacher', 'Educator', 'Guardian', 'Volunteer', 'Administrator']
+    existing = set(Group.objects.filter(name__in=names).values_list('name', flat=True))
+    Group.objects.bulk_create([Group(name=name) for name in names if name not in existing])
 
 
 class SendMailTest(TestCase):
@@ -103,8 +104,9 @@ from esp.tests.util import CacheFlushTestCase as TestCase
 
 
 def _setup_roles():
-    for name in ['Student', 'Teacher', 'Educator', 'Guardian', 'Volunteer', 'Administrator']:
-        Group.objects.get_or_create(name=name)
+    names = ['Student', 'Teacher', 'Educator', 'Guardian', 'Volunteer', 'Administrator']
+    existing = set(Group.objects.filter(name__in=names).values_list('name', flat=True))
+    Group.objects.bulk_create([Group(name=name) for name in names if name not in existing])
 
 
 class CronmailImportTest(TestCase):
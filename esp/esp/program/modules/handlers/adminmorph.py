@@ -42,17 +42,23 @@ from esp.users.models import ESPUser
 
 import operator
 
+#   The properties never change, so build the dict once at import time rather
+#   than on every registry enumeration.  "handler" is included up front so
+#   module_properties_autopopulated() never needs to mutate the shared dict.
+_MODULE_PROPS = {
+    "admin_title": "User Morphing Capability",
+    "link_title": "Morph into User",
+    "module_type": "manage",
+    "handler": "AdminMorph",
+    "seq": 34,
+    "choosable": 1,
+    }
+
 class AdminMorph(ProgramModuleObj):
     doc = """ User morphing allows the program director to morph into a constituent of their program. """
     @classmethod
     def module_properties(cls):
-        return {
-            "admin_title": "User Morphing Capability",
-            "link_title": "Morph into User",
-            "module_type": "manage",
-            "seq": 34,
-            "choosable": 1,
-            }
+        return _MODULE_PROPS
 
     @main_call
     @needs_admin
@@ -5,10 +5,15 @@ from django.db import migrations, models
 
 def populate_program(apps, schema_editor):
     Program = apps.get_model("program", "Program")
+    # Fetch the programs once instead of re-running the query per model name.
+    programs = list(Program.objects.all())
     for model_name in ["StudentClassRegModuleInfo", "ClassRegModuleInfo"]:
         ModuleInfo = apps.get_model("modules", model_name)
-        for program in Program.objects.all():
-            module_infos = ModuleInfo.objects.filter(module__program=program)
+        for program in programs:
+            # Materialize the queryset up front to make the single fetch
+            # explicit; the truthiness check and the [0]/[1:] accesses below
+            # all work off this one list.
+            module_infos = list(ModuleInfo.objects.filter(module__program=program))
             if module_infos:
                 # The old getModuleExtension just looked at the first one, so
                 # that's the one we'll keep around and update, and we'll delete
@@ -56,22 +56,31 @@ def updateModules(update_data, overwriteExisting=False, deleteExtra=False, model
     #   Select existing modules only by handler and module type, which are assumed to be unique.
     mods = []
     global_defaults = {'seq': 0, 'required': False}
+    #   Fetch all existing modules once and match them up in Python, rather
+    #   than issuing an existence check plus a fetch per entry.
+    existing_mods = {}
+    for mod in model.objects.all():
+        existing_mods.setdefault((mod.handler, mod.module_type), mod)
+    missing = []
     for datum in update_data:
-        query_kwargs = {'handler': datum["handler"], 'module_type': datum["module_type"]}
-        qs = model.objects.filter(**query_kwargs)
-        if qs.exists():
-            mods.append((datum, (qs[0], False)))
+        existing = existing_mods.get((datum["handler"], datum["module_type"]))
+        if existing is not None:
+            mods.append((datum, (existing, False)))
         else:
             if 'main_call' in datum:
                 datum.pop('main_call')
             if 'aux_calls' in datum:
                 datum.pop('aux_calls')
-            #   Ensure that all of the required fields are present when calling get_or_create
+            #   Ensure that all of the required fields are present
             new_obj_defaults = global_defaults.copy()
             new_obj_defaults.update(datum)
-            query_kwargs['defaults'] = new_obj_defaults
+            missing.append((datum, model(**new_obj_defaults)))
 
-            mods.append((datum, model.objects.get_or_create(**query_kwargs)))
+    #   Insert all of the missing modules with a single statement, instead of
+    #   one INSERT (plus get_or_create's SELECT) per module.
+    if missing:
+        model.objects.bulk_create([mod for (datum, mod) in missing])
+        mods.extend((datum, (mod, True)) for (datum, mod) in missing)
 
     if overwriteExisting:
         for (datum, (mod, created)) in mods:
@@ -80,10 +89,7 @@ def updateModules(update_data, overwriteExisting=False, deleteExtra=False, model
                 mod.save()
 
     if deleteExtra:
-        ids = []
-
-        for (datum, (mod, created)) in mods:
-            ids.append(mod.id)
+        ids = [mod.id for (datum, (mod, created)) in mods]
 
         ProgramModule.objects.exclude(id__in=ids).delete()
 
@@ -92,12 +98,16 @@ def updateModules(update_data, overwriteExisting=False, deleteExtra=False, model
         #   are null or blank, go ahead and add them.
         #   This simplifies data migrations where the default module properties
         #   are changed.
+        changed = False
         for key in datum:
             if (key not in mod.__dict__) or (mod.__dict__[key] is None) or (mod.__dict__[key] == ''):
                 if datum[key] is not None and datum[key] != '':
                     mod.__dict__[key] = datum[key]
+                    changed = True
 
-        mod.save()
+        #   Skip the UPDATE for the (common) modules that didn't change.
+        if changed:
+            mod.save()
 
 def install(model=None):
     """ Install the initial ProgramModule table data for all currently-existing modules """
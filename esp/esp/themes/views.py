@@ -334,7 +334,7 @@ def editor(request):
                 #   This is a nontrivial color value.  However, we only allow overriding
                 #   these variables with specific colors.
                 category_vars.append((key, 'color', ''))
-            elif initial_val.endswith('px') or initial_val.endswith('em'):
+            elif initial_val.endswith(('px', 'em')):
                 category_vars.append((key, 'length', initial_val))
             else:
                 category_vars.append((key, 'text', initial_val))
@@ -959,8 +959,13 @@ class BaseESPUser(object):
         """
         property_name = '_userclass_%s' % user_class
         if not hasattr(self, property_name):
+            # Fetch the user's group names once; the set answers this and all
+            # subsequent membership checks without issuing one EXISTS query
+            # per user class.
+            if not hasattr(self, '_role_names'):
+                self._role_names = set(self.groups.values_list('name', flat=True))
             role_name = {'Officer': 'Administrator'}.get(user_class, user_class)
-            setattr(self, property_name, self.groups.filter(name=role_name).exists())
+            setattr(self, property_name, role_name in self._role_names)
         return getattr(self, property_name)
 
     @classmethod
@@ -975,14 +980,24 @@ class BaseESPUser(object):
                 username = base_uname + str(i)
         return re.sub(r'[^\w.@+-]', '', username) # sanitize before returning
 
+    def _clear_role_cache(self):
+        """ Drop the per-instance role membership cache (see is_user_type). """
+        for attr in [a for a in self.__dict__ if a.startswith('_userclass_')]:
+            delattr(self, attr)
+        if hasattr(self, '_role_names'):
+            del self._role_names
+
     def makeVolunteer(self):
         self.groups.add(Group.objects.get_or_create(name="Volunteer")[0])
+        self._clear_role_cache()
 
     def makeRole(self, role_name):
         self.groups.add(Group.objects.get_or_create(name=role_name)[0])
+        self._clear_role_cache()
 
     def removeRole(self, role_name):
         self.groups.remove(Group.objects.get_or_create(name=role_name)[0])
+        self._clear_role_cache()
 
     def hasRole(self, role_name):
         return self.groups.filter(name=role_name).exists()
@@ -21,16 +21,24 @@ from esp.web.views.main import DefaultQSDView
 
 #   This is a huge hack while we figure out what to do about logins and cookies.
 #   - Michael P 12/28/2011
-def HttpMetaRedirect(location='/'):
-    response = HttpResponse()
-    response.status = 200
-    response.content = """
+
+#   The envelope is constant, so build it once; the handler just joins the
+#   pieces around the redirect location instead of re-parsing a format string.
+_META_REDIRECT_HEAD = """
     <html><head>
-    <meta http-equiv="refresh" content="0; url=%s">
+    <meta http-equiv="refresh" content="0; url="""
+_META_REDIRECT_BODY = """">
     </head>
-    <body>Thank you for logging in.  Please click <a href="%s">here</a> if you are not redirected.</body>
+    <body>Thank you for logging in.  Please click <a href=\""""
+_META_REDIRECT_TAIL = """">here</a> if you are not redirected.</body>
     </html>
-    """ % (location, location)
+    """
+
+def HttpMetaRedirect(location='/'):
+    response = HttpResponse()
+    response.status = 200
+    response.content = ''.join((_META_REDIRECT_HEAD, location, _META_REDIRECT_BODY,
+                                location, _META_REDIRECT_TAIL))
     return response
 
 mask_locations = ['/', '/myesp/signout', '/myesp/signout/', '/admin/logout/']
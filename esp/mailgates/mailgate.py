@@ -50,6 +50,9 @@ user = "UNKNOWN USER"
 def send_mail(message):
     p = os.popen("%s -i -t" % MAIL_PATH, 'w')
     p.write(message)
+    # flush and reap the sendmail process now, rather than holding the
+    # buffered pipe (and a copy of the message) open until GC gets to it
+    p.close()
 
 try:
     user = os.environ['LOCAL_PART']
@@ -106,16 +109,22 @@ try:
         message['Message-ID'] = '<%s@%s>' % (sha.new(str(random.random())).hexdigest(),
                                              host)
 
+        # a recipient can show up more than once (e.g. a director who also
+        # teaches); drop duplicates, keeping the first occurrence, so nobody
+        # gets a duplicate delivery
+        recipients = list(dict.fromkeys(instance.recipients))
+
         if handler.cc_all:
             # send one mass-email
-            message['To'] = ', '.join(instance.recipients)
+            message['To'] = ', '.join(recipients)
             send_mail(str(message))
         else:
             # send an email for each recipient
-            for recipient in instance.recipients:
-                del(message['To'])
-                message['To'] = recipient
-                send_mail(str(message))
+            # serialize the message (and any attachments it carries) once;
+            # each send just gets its own To: header prepended
+            base_message = str(message)
+            for recipient in recipients:
+                send_mail('To: %s\n%s' % (recipient, base_message))
 
         sys.exit(0)
 